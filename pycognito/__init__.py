@@ -1,6 +1,6 @@
 import ast
-import datetime
 import re
+import time
 
 import boto3
 from envs import env
@@ -316,10 +316,7 @@ class Cognito:
         """
         if not self.access_token:
             raise AttributeError("Access Token Required to Check Token")
-        now = datetime.datetime.now()
-        dec_access_token = jwt.get_unverified_claims(self.access_token)
-
-        if now > datetime.datetime.fromtimestamp(dec_access_token["exp"]):
+        if time.time() > jwt.get_unverified_claims(self.access_token)["exp"]:
             expired = True
             if renew:
                 self.renew_access_token()
@@ -4,55 +4,103 @@ from botocore.exceptions import ParamValidationError
 from botocore.stub import Stubber
 from mock import patch
 from envs import env
-from moto import mock_cognitoidp
-import boto3
 
 import pycognito
 from pycognito import Cognito, UserObj, GroupObj, TokenVerificationException
 from pycognito.aws_srp import AWSSRP
 
+USE_CLIENT_SECRET = env("USE_CLIENT_SECRET", "False") == "True"
+if USE_CLIENT_SECRET:
+    APP_ID = env("COGNITO_APP_WITH_SECRET_ID", "app")
+    CLIENT_SECRET = env("COGNITO_CLIENT_SECRET")
+else:
+    APP_ID = env("COGNITO_APP_ID", "app")
+    CLIENT_SECRET = None
+POOL_ID = env("COGNITO_USER_POOL_ID", "us-east-1_123456789")
+USERNAME = env("COGNITO_TEST_USERNAME", "bob")
+PASSWORD = env("COGNITO_TEST_PASSWORD", "bobpassword")
+NEW_PASSWORD = "crazypassword$45DOG"
+
+# Stubbed Cognito responses and the request parameters expected with them
+OK_RESPONSE = {"ResponseMetadata": {"HTTPStatusCode": 200}}
+AUTH_RESULT = {
+    "AuthenticationResult": {
+        "TokenType": "admin",
+        "IdToken": "dummy_token",
+        "AccessToken": "dummy_token",
+        "RefreshToken": "dummy_token",
+    }
+}
+REFRESH_AUTH_RESULT = {**AUTH_RESULT, **OK_RESPONSE}
+REFRESH_AUTH_PARAMS = {
+    "ClientId": APP_ID,
+    "AuthFlow": "REFRESH_TOKEN_AUTH",
+    "AuthParameters": {"REFRESH_TOKEN": "dummy_token"},
+}
+ADMIN_AUTH_PARAMS = {
+    "UserPoolId": POOL_ID,
+    "ClientId": APP_ID,
+    "AuthFlow": "ADMIN_NO_SRP_AUTH",
+    "AuthParameters": {"USERNAME": USERNAME, "PASSWORD": PASSWORD},
+}
+ADMIN_GET_USER_RESPONSE = {
+    "Enabled": True,
+    "UserStatus": "CONFIRMED",
+    "Username": USERNAME,
+    "UserAttributes": [],
+}
+ADMIN_GET_USER_PARAMS = {"UserPoolId": POOL_ID, "Username": USERNAME}
+CHANGE_PASSWORD_PARAMS = {
+    "PreviousPassword": PASSWORD,
+    "ProposedPassword": NEW_PASSWORD,
+    "AccessToken": "dummy_token",
+}
+SRP_AUTH_PARAMS = {"USERNAME": "bob", "SRP_A": "srp"}
+SRP_CHALLENGE = {"ChallengeName": "PASSWORD_VERIFIER", "ChallengeParameters": {}}
+SRP_INITIATE_AUTH_PARAMS = {
+    "AuthFlow": "USER_SRP_AUTH",
+    "AuthParameters": SRP_AUTH_PARAMS,
+    "ClientId": APP_ID,
+}
+SRP_CHALLENGE_RESPONSE_PARAMS = {
+    "ClientId": APP_ID,
+    "ChallengeName": "PASSWORD_VERIFIER",
+    "ChallengeResponses": {},
+}
+
+
+def _add_response(stub, method, response, params):
+    stub.add_response(method, service_response=response, expected_params=params)
+
 
 def _mock_authenticate_user(_, client=None):
-    return {
-        "AuthenticationResult": {
-            "TokenType": "admin",
-            "IdToken": "dummy_token",
-            "AccessToken": "dummy_token",
-            "RefreshToken": "dummy_token",
-        }
-    }
+    return AUTH_RESULT
 
 
 def _mock_get_params(_):
-    return {"USERNAME": "bob", "SRP_A": "srp"}
+    return SRP_AUTH_PARAMS
 
 
 def _mock_verify_tokens(self, token, id_name, token_use):
-    if "wrong" in token:
+    if token.endswith("wrong"):
         raise TokenVerificationException
     setattr(self, id_name, token)
 
 
 class UserObjTestCase(unittest.TestCase):
-    def setUp(self):
-        if env("USE_CLIENT_SECRET", "False") == "True":
-            self.app_id = env("COGNITO_APP_WITH_SECRET_ID")
-        else:
-            self.app_id = env("COGNITO_APP_ID")
-        self.cognito_user_pool_id = env("COGNITO_USER_POOL_ID", "us-east-1_123456789")
-        self.username = env("COGNITO_TEST_USERNAME")
-
-        self.user = Cognito(
-            user_pool_id=self.cognito_user_pool_id,
-            client_id=self.app_id,
-            username=self.username,
+    @classmethod
+    def setUpClass(cls):
+        cls.user = Cognito(
+            user_pool_id=POOL_ID,
+            client_id=APP_ID,
+            username=USERNAME,
         )
 
-        self.user_metadata = {
+        cls.user_metadata = {
             "user_status": "CONFIRMED",
             "username": "bjones",
         }
-        self.user_info = [
+        cls.user_info = [
             {"Name": "name", "Value": "Brian Jones"},
             {"Name": "given_name", "Value": "Brian"},
             {"Name": "birthdate", "Value": "12/7/1980"},
@@ -66,46 +114,32 @@ class UserObjTestCase(unittest.TestCase):
 
 
 class GroupObjTestCase(unittest.TestCase):
-    def setUp(self):
-        if env("USE_CLIENT_SECRET", "False") == "True":
-            self.app_id = env("COGNITO_APP_WITH_SECRET_ID")
-        else:
-            self.app_id = env("COGNITO_APP_ID")
-        self.cognito_user_pool_id = env("COGNITO_USER_POOL_ID", "us-east-1_123456789")
-        self.group_data = {"GroupName": "test_group", "Precedence": 1}
-        self.cognito_obj = Cognito(
-            user_pool_id=self.cognito_user_pool_id, client_id=self.app_id
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.cognito_obj = Cognito(user_pool_id=POOL_ID, client_id=APP_ID)
 
     def test_init(self):
-        group = GroupObj(group_data=self.group_data, cognito_obj=self.cognito_obj)
+        group_data = {"GroupName": "test_group", "Precedence": 1}
+        group = GroupObj(group_data=group_data, cognito_obj=self.cognito_obj)
         self.assertEqual(group.group_name, "test_group")
         self.assertEqual(group.precedence, 1)
 
 
 class CognitoAuthTestCase(unittest.TestCase):
     def setUp(self):
-        if env("USE_CLIENT_SECRET") == "True":
-            self.app_id = env("COGNITO_APP_WITH_SECRET_ID", "app")
-            self.client_secret = env("COGNITO_CLIENT_SECRET")
-        else:
-            self.app_id = env("COGNITO_APP_ID", "app")
-            self.client_secret = None
-        self.cognito_user_pool_id = env("COGNITO_USER_POOL_ID", "us-east-1_123456789")
-        self.username = env("COGNITO_TEST_USERNAME", "bob")
-        self.password = env("COGNITO_TEST_PASSWORD", "bobpassword")
+        # Built per test since the tests set tokens on it and stub its client
         self.user = Cognito(
-            self.cognito_user_pool_id,
-            self.app_id,
-            username=self.username,
-            client_secret=self.client_secret,
+            POOL_ID,
+            APP_ID,
+            username=USERNAME,
+            client_secret=CLIENT_SECRET,
         )
 
     @patch("pycognito.aws_srp.AWSSRP.authenticate_user", _mock_authenticate_user)
     @patch("pycognito.Cognito.verify_token", _mock_verify_tokens)
     def test_authenticate(self):
 
-        self.user.authenticate(self.password)
+        self.user.authenticate(PASSWORD)
         self.assertNotEqual(self.user.access_token, None)
         self.assertNotEqual(self.user.id_token, None)
         self.assertNotEqual(self.user.refresh_token, None)
@@ -113,7 +147,7 @@ class CognitoAuthTestCase(unittest.TestCase):
     @patch("pycognito.aws_srp.AWSSRP.authenticate_user", _mock_authenticate_user)
     @patch("pycognito.Cognito.verify_token", _mock_verify_tokens)
     def test_verify_token(self):
-        self.user.authenticate(self.password)
+        self.user.authenticate(PASSWORD)
         bad_access_token = "{}wrong".format(self.user.access_token)
 
         with self.assertRaises(TokenVerificationException):
@@ -121,9 +155,7 @@ class CognitoAuthTestCase(unittest.TestCase):
 
     @patch("pycognito.Cognito", autospec=True)
     def test_register(self, cognito_user):
-        user = cognito_user(
-            self.cognito_user_pool_id, self.app_id, username=self.username
-        )
+        user = cognito_user(POOL_ID, APP_ID, username=USERNAME)
         base_attr = dict(
             given_name="Brian",
             family_name="Jones",
@@ -146,57 +178,29 @@ class CognitoAuthTestCase(unittest.TestCase):
 
         # By the stubber nature, we need to add the sequence
         # of calls for the AWS SRP auth to test the whole process
-        stub.add_response(
-            method="initiate_auth",
-            service_response={
-                "AuthenticationResult": {
-                    "TokenType": "admin",
-                    "IdToken": "dummy_token",
-                    "AccessToken": "dummy_token",
-                    "RefreshToken": "dummy_token",
-                },
-                "ResponseMetadata": {"HTTPStatusCode": 200},
-            },
-            expected_params={
-                "ClientId": self.app_id,
-                "AuthFlow": "REFRESH_TOKEN_AUTH",
-                "AuthParameters": {"REFRESH_TOKEN": "dummy_token"},
-            },
-        )
+        _add_response(stub, "initiate_auth", REFRESH_AUTH_RESULT, REFRESH_AUTH_PARAMS)
 
         with stub:
-            self.user.authenticate(self.password)
+            self.user.authenticate(PASSWORD)
             self.user.renew_access_token()
             stub.assert_no_pending_responses()
 
     @patch("pycognito.Cognito", autospec=True)
     def test_update_profile(self, cognito_user):
-        user = cognito_user(
-            self.cognito_user_pool_id, self.app_id, username=self.username
-        )
-        user.authenticate(self.password)
+        user = cognito_user(POOL_ID, APP_ID, username=USERNAME)
+        user.authenticate(PASSWORD)
         user.update_profile({"given_name": "Jenkins"})
 
     def test_admin_get_user(self):
         stub = Stubber(self.user.client)
 
-        stub.add_response(
-            method="admin_get_user",
-            service_response={
-                "Enabled": True,
-                "UserStatus": "CONFIRMED",
-                "Username": self.username,
-                "UserAttributes": [],
-            },
-            expected_params={
-                "UserPoolId": self.cognito_user_pool_id,
-                "Username": self.username,
-            },
+        _add_response(
+            stub, "admin_get_user", ADMIN_GET_USER_RESPONSE, ADMIN_GET_USER_PARAMS
         )
 
         with stub:
-            u = self.user.admin_get_user(self.username)
-            self.assertEqual(u.username, self.username)
+            u = self.user.admin_get_user(USERNAME)
+            self.assertEqual(u.username, USERNAME)
             stub.assert_no_pending_responses()
 
     def test_check_token(self):
@@ -208,47 +212,47 @@ class CognitoAuthTestCase(unittest.TestCase):
         )
         self.assertFalse(self.user.check_token())
 
+    def test_check_token_expired(self):
+        # This is a sample JWT with an expiration time set to January, 18th, 2018
+        self.user.access_token = (
+            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJzdWIiOiIxMjM0NTY3ODkwIiwibmFtZSI6IkpvaG4gRG"
+            "9lIiwiaWF0IjoxNTE2MjM5MDIyLCJleHAiOjE1MTYyMzkwMjJ9.C-1gPxrhUsiWeCvMvaZuuQYarkDNAc"
+            "pEGJPIqu_SrKQ"
+        )
+        self.assertTrue(self.user.check_token(renew=False))
+
     @patch("pycognito.Cognito", autospec=True)
     def test_validate_verification(self, cognito_user):
-        u = cognito_user(self.cognito_user_pool_id, self.app_id, username=self.username)
+        u = cognito_user(POOL_ID, APP_ID, username=USERNAME)
         u.validate_verification("4321")
 
     @patch("pycognito.Cognito", autospec=True)
     def test_confirm_forgot_password(self, cognito_user):
-        u = cognito_user(self.cognito_user_pool_id, self.app_id, username=self.username)
+        u = cognito_user(POOL_ID, APP_ID, username=USERNAME)
         u.confirm_forgot_password("4553", "samplepassword")
         with self.assertRaises(TypeError):
-            u.confirm_forgot_password(self.password)
+            u.confirm_forgot_password(PASSWORD)
 
     @patch("pycognito.aws_srp.AWSSRP.authenticate_user", _mock_authenticate_user)
     @patch("pycognito.Cognito.verify_token", _mock_verify_tokens)
     @patch("pycognito.Cognito.check_token", return_value=True)
     def test_change_password(self, _):
-        # u = cognito_user(self.cognito_user_pool_id, self.app_id,
-        #                  username=self.username)
-        self.user.authenticate(self.password)
+        # u = cognito_user(POOL_ID, APP_ID, username=USERNAME)
+        self.user.authenticate(PASSWORD)
 
         stub = Stubber(self.user.client)
 
-        stub.add_response(
-            method="change_password",
-            service_response={"ResponseMetadata": {"HTTPStatusCode": 200}},
-            expected_params={
-                "PreviousPassword": self.password,
-                "ProposedPassword": "crazypassword$45DOG",
-                "AccessToken": self.user.access_token,
-            },
-        )
+        _add_response(stub, "change_password", OK_RESPONSE, CHANGE_PASSWORD_PARAMS)
 
         with stub:
-            self.user.change_password(self.password, "crazypassword$45DOG")
+            self.user.change_password(PASSWORD, NEW_PASSWORD)
             stub.assert_no_pending_responses()
 
         with self.assertRaises(ParamValidationError):
-            self.user.change_password(self.password, None)
+            self.user.change_password(PASSWORD, None)
 
     def test_set_attributes(self):
-        user = Cognito(self.cognito_user_pool_id, self.app_id)
+        user = Cognito(POOL_ID, APP_ID)
         user._set_attributes(
             {"ResponseMetadata": {"HTTPStatusCode": 200}}, {"somerandom": "attribute"}
         )
@@ -261,29 +265,10 @@ class CognitoAuthTestCase(unittest.TestCase):
 
         # By the stubber nature, we need to add the sequence
         # of calls for the AWS SRP auth to test the whole process
-        stub.add_response(
-            method="admin_initiate_auth",
-            service_response={
-                "AuthenticationResult": {
-                    "TokenType": "admin",
-                    "IdToken": "dummy_token",
-                    "AccessToken": "dummy_token",
-                    "RefreshToken": "dummy_token",
-                }
-            },
-            expected_params={
-                "UserPoolId": self.cognito_user_pool_id,
-                "ClientId": self.app_id,
-                "AuthFlow": "ADMIN_NO_SRP_AUTH",
-                "AuthParameters": {
-                    "USERNAME": self.username,
-                    "PASSWORD": self.password,
-                },
-            },
-        )
+        _add_response(stub, "admin_initiate_auth", AUTH_RESULT, ADMIN_AUTH_PARAMS)
 
         with stub:
-            self.user.admin_authenticate(self.password)
+            self.user.admin_authenticate(PASSWORD)
             self.assertNotEqual(self.user.access_token, None)
             self.assertNotEqual(self.user.id_token, None)
             self.assertNotEqual(self.user.refresh_token, None)
@@ -292,22 +277,13 @@ class CognitoAuthTestCase(unittest.TestCase):
 
 class AWSSRPTestCase(unittest.TestCase):
     def setUp(self):
-        if env("USE_CLIENT_SECRET") == "True":
-            self.client_secret = env("COGNITO_CLIENT_SECRET")
-            self.app_id = env("COGNITO_APP_WITH_SECRET_ID", "app")
-        else:
-            self.app_id = env("COGNITO_APP_ID", "app")
-            self.client_secret = None
-        self.cognito_user_pool_id = env("COGNITO_USER_POOL_ID", "us-east-1_123456789")
-        self.username = env("COGNITO_TEST_USERNAME")
-        self.password = env("COGNITO_TEST_PASSWORD")
         self.aws = AWSSRP(
-            username=self.username,
-            password=self.password,
+            username=USERNAME,
+            password=PASSWORD,
             pool_region="us-east-1",
-            pool_id=self.cognito_user_pool_id,
-            client_id=self.app_id,
-            client_secret=self.client_secret,
+            pool_id=POOL_ID,
+            client_id=APP_ID,
+            client_secret=CLIENT_SECRET,
         )
 
     def tearDown(self):
@@ -321,33 +297,13 @@ class AWSSRPTestCase(unittest.TestCase):
 
         # By the stubber nature, we need to add the sequence
         # of calls for the AWS SRP auth to test the whole process
-        stub.add_response(
-            method="initiate_auth",
-            service_response={
-                "ChallengeName": "PASSWORD_VERIFIER",
-                "ChallengeParameters": {},
-            },
-            expected_params={
-                "AuthFlow": "USER_SRP_AUTH",
-                "AuthParameters": _mock_get_params(None),
-                "ClientId": self.app_id,
-            },
-        )
+        _add_response(stub, "initiate_auth", SRP_CHALLENGE, SRP_INITIATE_AUTH_PARAMS)
 
-        stub.add_response(
-            method="respond_to_auth_challenge",
-            service_response={
-                "AuthenticationResult": {
-                    "IdToken": "dummy_token",
-                    "AccessToken": "dummy_token",
-                    "RefreshToken": "dummy_token",
-                }
-            },
-            expected_params={
-                "ClientId": self.app_id,
-                "ChallengeName": "PASSWORD_VERIFIER",
-                "ChallengeResponses": {},
-            },
+        _add_response(
+            stub,
+            "respond_to_auth_challenge",
+            AUTH_RESULT,
+            SRP_CHALLENGE_RESPONSE_PARAMS,
         )
 
         with stub:
@@ -360,105 +316,315 @@ class AWSSRPTestCase(unittest.TestCase):
 
 
 class CognitoAdminTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool_id = "us-west-2_123456789"
+        cls.client_id = "clientid"
+        cls.client_secret = "clientsecret"
+
+        cls.access_key_id = "accesskeyid"
+        cls.secret_access_key = "secretaccesskey"
 
     def setUp(self):
-        self.cognito_idp_patcher = mock_cognitoidp()
-        self.mock_cognitoidp = self.cognito_idp_patcher.start()
-        self.mock_conn = boto3.client("cognito-idp", "us-west-2")
-        self.pool_id = self.mock_conn.create_user_pool(PoolName="userpool")["UserPool"]["Id"]
-        self.mock_conn.admin_create_user(UserPoolId=self.pool_id, Username="default_user", UserAttributes=[{"Name":"thing", "Value": "Default User"}])
-        self.mock_conn.create_group(GroupName="default_group", UserPoolId=self.pool_id)
-        self.mock_conn.create_group(GroupName="test_group", UserPoolId=self.pool_id)
-        self.mock_conn.admin_add_user_to_group(UserPoolId=self.pool_id, Username="default_user", GroupName="default_group")
-        self.client_id = 'clientid'
-        self.client_secret = 'clientsecret'
-
-        self.access_key_id = 'accesskeyid'
-        self.secret_access_key = 'secretaccesskey'
-        self.cognito = pycognito.Cognito(self.pool_id,
-                                         self.client_id,
-                                         client_secret=self.client_secret,
-                                         access_key=self.access_key_id,
-                                         secret_key=self.secret_access_key)
+        # Built per test since admin_create_user sets attributes on it
+        self.cognito = pycognito.Cognito(
+            self.pool_id,
+            self.client_id,
+            client_secret=self.client_secret,
+            access_key=self.access_key_id,
+            secret_key=self.secret_access_key,
+        )
 
-    def tearDown(self):
-        self.cognito_idp_patcher.stop()
+    def _add_create_user_response(self, stub, username, attributes, **params):
+        _add_response(
+            stub,
+            "admin_create_user",
+            {
+                "User": {
+                    "Username": username,
+                    "Attributes": attributes,
+                    "Enabled": True,
+                    "UserStatus": "FORCE_CHANGE_PASSWORD",
+                },
+                "ResponseMetadata": {"HTTPStatusCode": 200},
+            },
+            {
+                "UserPoolId": self.pool_id,
+                "Username": username,
+                "UserAttributes": attributes,
+                **params,
+            },
+        )
+
+    def _add_get_user_response(self, stub, enabled=True):
+        _add_response(
+            stub,
+            "admin_get_user",
+            {
+                "Username": "default_user",
+                "UserAttributes": [{"Name": "thing", "Value": "Default User"}],
+                "Enabled": enabled,
+                "UserStatus": "CONFIRMED",
+            },
+            {"UserPoolId": self.pool_id, "Username": "default_user"},
+        )
+
+    def _add_list_groups_response(self, stub, groups):
+        _add_response(
+            stub,
+            "admin_list_groups_for_user",
+            {"Groups": [{"GroupName": group} for group in groups]},
+            {
+                "UserPoolId": self.pool_id,
+                "Username": "default_user",
+                "Limit": 60,
+            },
+        )
 
     def test_admin_create_user_explicit_password(self):
-        ret = self.cognito.admin_create_user("test_user", "password")
-        self.assertIsInstance(ret, UserObj)
+        stub = Stubber(self.cognito.client)
+        self._add_create_user_response(
+            stub, "test_user", [], TemporaryPassword="password"
+        )
+
+        with stub:
+            ret = self.cognito.admin_create_user("test_user", "password")
+            self.assertIsInstance(ret, UserObj)
+            stub.assert_no_pending_responses()
 
     def test_admin_create_user_no_password(self):
-        ret = self.cognito.admin_create_user("test_user")
-        self.assertIsInstance(ret, UserObj)
+        stub = Stubber(self.cognito.client)
+        self._add_create_user_response(stub, "test_user", [])
+
+        with stub:
+            ret = self.cognito.admin_create_user("test_user")
+            self.assertIsInstance(ret, UserObj)
+            stub.assert_no_pending_responses()
 
     def test_admin_create_user_with_attributes(self):
-        ret = self.cognito.admin_create_user("test_user", thing="Test User")
-        self.assertEqual(ret.thing, "Test User")
+        stub = Stubber(self.cognito.client)
+        self._add_create_user_response(
+            stub, "test_user", [{"Name": "thing", "Value": "Test User"}]
+        )
+
+        with stub:
+            ret = self.cognito.admin_create_user("test_user", thing="Test User")
+            self.assertEqual(ret.thing, "Test User")
+            stub.assert_no_pending_responses()
 
     def test_admin_resend_invitation(self):
-        ret = self.cognito.admin_resend_invitation("default_user")
-        self.assertIsInstance(ret, UserObj)
+        stub = Stubber(self.cognito.client)
+        self._add_get_user_response(stub)
+        self._add_list_groups_response(stub, [])
+        self._add_create_user_response(
+            stub,
+            "default_user",
+            [{"Name": "thing", "Value": "Default User"}],
+            MessageAction="RESEND",
+        )
+
+        with stub:
+            ret = self.cognito.admin_resend_invitation("default_user")
+            self.assertIsInstance(ret, UserObj)
+            stub.assert_no_pending_responses()
 
     def test_admin_resend_invitation_preserves_groups_if_omitted(self):
-        ret = self.cognito.admin_resend_invitation("default_user")
-        groups = self.cognito.admin_list_groups_for_user("default_user")
-        self.assertEqual(groups, ["default_group"])
+        stub = Stubber(self.cognito.client)
+        self._add_get_user_response(stub)
+        self._add_list_groups_response(stub, ["default_group"])
+        self._add_create_user_response(
+            stub,
+            "default_user",
+            [{"Name": "thing", "Value": "Default User"}],
+            MessageAction="RESEND",
+        )
+        _add_response(
+            stub,
+            "admin_add_user_to_group",
+            {},
+            {
+                "UserPoolId": self.pool_id,
+                "Username": "default_user",
+                "GroupName": "default_group",
+            },
+        )
+
+        with stub:
+            self.cognito.admin_resend_invitation("default_user")
+            stub.assert_no_pending_responses()
 
     def test_admin_resend_invitation_overwrites_groups_if_passed(self):
-        ret = self.cognito.admin_resend_invitation("default_user", groups=[])
-        groups = self.cognito.admin_list_groups_for_user("default_user")
-        self.assertEqual(groups, [])
+        stub = Stubber(self.cognito.client)
+        self._add_get_user_response(stub)
+        self._add_create_user_response(
+            stub,
+            "default_user",
+            [{"Name": "thing", "Value": "Default User"}],
+            MessageAction="RESEND",
+        )
+
+        with stub:
+            self.cognito.admin_resend_invitation("default_user", groups=[])
+            stub.assert_no_pending_responses()
 
     def test_admin_resend_invitation_missing_user(self):
-        with self.assertRaises(self.mock_conn.exceptions.UserNotFoundException):
-            ret = self.cognito.admin_resend_invitation("test_user")
+        stub = Stubber(self.cognito.client)
+        stub.add_client_error(
+            method="admin_get_user",
+            service_error_code="UserNotFoundException",
+            expected_params={"UserPoolId": self.pool_id, "Username": "test_user"},
+        )
+
+        with stub:
+            with self.assertRaises(
+                self.cognito.client.exceptions.UserNotFoundException
+            ):
+                self.cognito.admin_resend_invitation("test_user")
+            stub.assert_no_pending_responses()
 
     def test_admin_delete_user(self):
-        self.cognito.admin_delete_user("default_user")
+        stub = Stubber(self.cognito.client)
+        _add_response(
+            stub,
+            "admin_delete_user",
+            {},
+            {"UserPoolId": self.pool_id, "Username": "default_user"},
+        )
+
+        with stub:
+            self.cognito.admin_delete_user("default_user")
+            stub.assert_no_pending_responses()
 
     def test_admin_get_user(self):
-        ret = self.cognito.admin_get_user("default_user")
-        self.assertEqual(ret.thing, "Default User")
+        stub = Stubber(self.cognito.client)
+        self._add_get_user_response(stub)
+
+        with stub:
+            ret = self.cognito.admin_get_user("default_user")
+            self.assertEqual(ret.thing, "Default User")
+            stub.assert_no_pending_responses()
 
     def test_admin_reset_password(self):
-        try:
-            ret = self.cognito.admin_reset_password("default_user")
-        except NotImplementedError:
-            unittest.skip("admin_reset_password not yet supported by moto")
+        stub = Stubber(self.cognito.client)
+        _add_response(
+            stub,
+            "admin_reset_user_password",
+            {},
+            {"UserPoolId": self.pool_id, "Username": "default_user"},
+        )
+
+        with stub:
+            self.cognito.admin_reset_password("default_user")
+            stub.assert_no_pending_responses()
 
     def test_admin_list_groups_for_user(self):
-        ret = self.cognito.admin_list_groups_for_user("default_user")
-        self.assertEqual(ret, ["default_group"])
+        stub = Stubber(self.cognito.client)
+        self._add_list_groups_response(stub, ["default_group"])
+
+        with stub:
+            ret = self.cognito.admin_list_groups_for_user("default_user")
+            self.assertEqual(ret, ["default_group"])
+            stub.assert_no_pending_responses()
 
     def test_admin_add_user_to_group(self):
-        self.cognito.admin_add_user_to_group("default_user", "test_group")
-        groups = self.cognito.admin_list_groups_for_user("default_user")
-        self.assertIn("test_group", groups)
+        stub = Stubber(self.cognito.client)
+        _add_response(
+            stub,
+            "admin_add_user_to_group",
+            {},
+            {
+                "UserPoolId": self.pool_id,
+                "Username": "default_user",
+                "GroupName": "test_group",
+            },
+        )
+
+        with stub:
+            self.cognito.admin_add_user_to_group("default_user", "test_group")
+            stub.assert_no_pending_responses()
 
     def test_admin_remove_user_from_group(self):
-        self.cognito.admin_remove_user_from_group("default_user", "default_group")
-        groups = self.cognito.admin_list_groups_for_user("default_user")
-        self.assertNotIn("default_group", groups)
+        stub = Stubber(self.cognito.client)
+        _add_response(
+            stub,
+            "admin_remove_user_from_group",
+            {},
+            {
+                "UserPoolId": self.pool_id,
+                "Username": "default_user",
+                "GroupName": "default_group",
+            },
+        )
+
+        with stub:
+            self.cognito.admin_remove_user_from_group("default_user", "default_group")
+            stub.assert_no_pending_responses()
 
     def test_admin_enable_user(self):
-        ret = self.cognito.admin_enable_user("default_user")
-        user = self.cognito.admin_get_user("default_user")
-        self.assertTrue(user.enabled)
+        stub = Stubber(self.cognito.client)
+        _add_response(
+            stub,
+            "admin_enable_user",
+            {},
+            {"UserPoolId": self.pool_id, "Username": "default_user"},
+        )
+        self._add_get_user_response(stub, enabled=True)
+
+        with stub:
+            self.cognito.admin_enable_user("default_user")
+            user = self.cognito.admin_get_user("default_user")
+            self.assertTrue(user.enabled)
+            stub.assert_no_pending_responses()
 
     def test_admin_disable_user(self):
-        ret = self.cognito.admin_disable_user("default_user")
-        user = self.cognito.admin_get_user("default_user")
-        self.assertFalse(user.enabled)
+        stub = Stubber(self.cognito.client)
+        _add_response(
+            stub,
+            "admin_disable_user",
+            {},
+            {"UserPoolId": self.pool_id, "Username": "default_user"},
+        )
+        self._add_get_user_response(stub, enabled=False)
+
+        with stub:
+            self.cognito.admin_disable_user("default_user")
+            user = self.cognito.admin_get_user("default_user")
+            self.assertFalse(user.enabled)
+            stub.assert_no_pending_responses()
 
     def test_admin_set_password(self):
-        self.cognito.admin_set_user_password(username="default_user", password="newpassword")
+        stub = Stubber(self.cognito.client)
+        _add_response(
+            stub,
+            "admin_set_user_password",
+            {},
+            {
+                "UserPoolId": self.pool_id,
+                "Username": "default_user",
+                "Password": "newpassword",
+                "Permanent": False,
+            },
+        )
+
+        with stub:
+            self.cognito.admin_set_user_password(
+                username="default_user", password="newpassword"
+            )
+            stub.assert_no_pending_responses()
 
     def test_admin_user_global_sign_out(self):
-        try:
+        stub = Stubber(self.cognito.client)
+        _add_response(
+            stub,
+            "admin_user_global_sign_out",
+            {},
+            {"UserPoolId": self.pool_id, "Username": "default_user"},
+        )
+
+        with stub:
             self.cognito.admin_user_global_sign_out("default_user")
-        except NotImplementedError:
-            unittest.skip("admin_user_global_sign_out not yet supported by moto")
+            stub.assert_no_pending_responses()
+
 
 if __name__ == "__main__":
     unittest.main()